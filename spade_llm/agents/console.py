@@ -1,4 +1,8 @@
+import asyncio
+import sys
 from asyncio import sleep as asleep
+from collections import deque
+from typing import Optional
 
 from aioconsole import ainput
 from pydantic import BaseModel, Field
@@ -63,12 +67,66 @@ class InputBehavior(ContextBehaviour):
     def __init__(self, context: AgentContext, config: ConsoleAgentConf):
         super().__init__(context)
         self.config = config
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._reader_unavailable = False
+        self._pending: deque[str] = deque()
+
+    async def _connect_reader(self) -> Optional[asyncio.StreamReader]:
+        try:
+            reader = asyncio.StreamReader()
+            protocol = asyncio.StreamReaderProtocol(reader)
+            await asyncio.get_running_loop().connect_read_pipe(lambda: protocol, sys.stdin)
+            return reader
+        except (ValueError, OSError):
+            # stdin redirected from a regular file is not a pipe, fall back to ainput
+            self._reader_unavailable = True
+            return None
+
+    async def _read_from_reader(self) -> Optional[str]:
+        line = await self._reader.readline()
+        if not line:
+            return None
+        # Drain whatever complete lines are already available to batch subsequent reads.
+        # A short timeout turns "no full line buffered yet" into a TimeoutError while a
+        # cancelled readline leaves the stream intact for the next read.
+        while not self._reader.at_eof():
+            try:
+                more = await asyncio.wait_for(self._reader.readline(), timeout=0.01)
+            except asyncio.TimeoutError:
+                break
+            if not more:
+                break
+            self._pending.append(more.decode().rstrip("\n"))
+        return line.decode().rstrip("\n")
+
+    async def _read_line(self) -> Optional[str]:
+        """
+        Reads the next input line. In interactive mode prompts via aioconsole, for piped input
+        reads through an asyncio.StreamReader and drains all complete lines already buffered,
+        so subsequent steps are served without an event-loop round-trip. Falls back to ainput
+        when stdin cannot be attached to the loop. Returns None on end of input.
+        """
+        if self._pending:
+            return self._pending.popleft()
+        if self._reader is not None:
+            # Once connected stay on the reader, the transport owns stdin from here on
+            return await self._read_from_reader()
+        if sys.stdin.isatty():
+            # Small hack to let all the logs to be printed before prompting
+            await asleep(0.5)
+            return await ainput(self.config.prompt)
+        if not self._reader_unavailable:
+            self._reader = await self._connect_reader()
+            if self._reader is not None:
+                return await self._read_from_reader()
+        try:
+            return await ainput()
+        except EOFError:
+            return None
 
     async def step(self):
-        # Small hack to let all the logs to be printed before prompting
-        await asleep(0.5)
-        user_input = await ainput(self.config.prompt)
-        if user_input.lower() in self.config.stop_words:
+        user_input = await self._read_line()
+        if user_input is None or user_input.lower() in self.config.stop_words:
             self.agent.stop()
             self.set_is_done()
         else:
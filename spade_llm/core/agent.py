@@ -3,6 +3,7 @@ import threading
 import uuid
 from abc import ABCMeta, abstractmethod
 from asyncio import AbstractEventLoop
+from collections import OrderedDict
 from typing import Dict, List, Optional
 
 import logging
@@ -13,6 +14,9 @@ from spade_llm.core.api import Message, AgentHandler, AgentContext
 from spade_llm.core.behaviors import Behaviour, MessageHandlingBehavior, BehaviorsOwner
 
 class MessageDispatcher(metaclass=ABCMeta):
+    # Empty slots so that subclasses with __slots__ do not get a __dict__ from the base
+    __slots__ = ()
+
     @abstractmethod
     def add_behaviour(self, beh):
         """
@@ -40,12 +44,27 @@ class MessageDispatcher(metaclass=ABCMeta):
 
 class PerformativeDispatcher(MessageDispatcher):
     """
-    Stores behaviors grouped by performative configured in their templates. Uses dictionary with performative
-    as a key and list of behaviors as values plus extra list for behaviors without performative specified.
+    Stores behaviors grouped by performative configured in their templates. Behaviors are
+    pre-split at insertion time into two dictionaries keyed by performative: one for
+    validator-less templates matched with hash lookups only, and one for templates with
+    validators which have to be evaluated per message. This keeps the None-compare branch
+    out of the inner matching loop.
+
+    Lookups for templates without a validator depend only on the message performative and thread id,
+    so their results are memoized in a small LRU cache keyed by these fields.
     """
 
+    __slots__ = ("_fast_by_perf", "_validated_by_perf", "_cache", "_catch_all_single", "_count", "logger")
+
+    # Maximum number of distinct (performative, thread_id) keys memoized per dispatcher
+    _CACHE_SIZE = 128
+
     def __init__(self, logger):
-        self._behaviors_by_performative: Dict[Optional[str], List[MessageHandlingBehavior]] = {}
+        self._fast_by_perf: Dict[Optional[str], List[MessageHandlingBehavior]] = {}
+        self._validated_by_perf: Dict[Optional[str], List[MessageHandlingBehavior]] = {}
+        self._cache: OrderedDict[tuple, tuple[MessageHandlingBehavior, ...]] = OrderedDict()
+        self._catch_all_single: Optional[MessageHandlingBehavior] = None
+        self._count = 0
         self.logger = logger
 
     def add_behaviour(self, beh: MessageHandlingBehavior):
@@ -54,9 +73,13 @@ class PerformativeDispatcher(MessageDispatcher):
         :param beh: Behavior to add.
         """
         performative = beh.template.performative
-        if performative not in self._behaviors_by_performative:
-            self._behaviors_by_performative[performative] = []
-        self._behaviors_by_performative[performative].append(beh)
+        store = self._validated_by_perf if beh.template._has_validator else self._fast_by_perf
+        if performative not in store:
+            store[performative] = []
+        store[performative].append(beh)
+        self._count += 1
+        self._cache.clear()
+        self._update_catch_all()
         self.logger.debug("Added behavior %s with performative %s", beh, performative)
 
     def remove_behaviour(self, beh: MessageHandlingBehavior):
@@ -65,37 +88,90 @@ class PerformativeDispatcher(MessageDispatcher):
         :param beh: Behavior to remove.
         """
         performative = beh.template.performative
-        if performative in self._behaviors_by_performative:
-            self._behaviors_by_performative[performative].remove(beh)
-            if not self._behaviors_by_performative[performative]:
-                del self._behaviors_by_performative[performative]
+        store = self._validated_by_perf if beh.template._has_validator else self._fast_by_perf
+        if performative in store:
+            store[performative].remove(beh)
+            if not store[performative]:
+                del store[performative]
+            self._count -= 1
+            self._cache.clear()
+            self._update_catch_all()
             self.logger.debug("Removed behavior %s with performative %s", beh, performative)
 
+    def _update_catch_all(self):
+        """
+        Remembers the single registered behavior when its template matches any message, so
+        find_matching_behaviour can hand it out without lookups (runtime specialization of
+        the echo-like catch-all case).
+        """
+        if not self._validated_by_perf and len(self._fast_by_perf) == 1 and None in self._fast_by_perf:
+            behaviors = self._fast_by_perf[None]
+            if len(behaviors) == 1 and behaviors[0].template.thread_id is None:
+                self._catch_all_single = behaviors[0]
+                return
+        self._catch_all_single = None
+
     def find_matching_behaviour(self, msg: Message):
-        """Yields all behaviors matching the given message."""
+        """Yields all behaviors matching the given message. Validator-less behaviors are yielded
+        first (possibly from cache), followed by behaviors with validators."""
+        catch_all = self._catch_all_single
+        if catch_all is not None:
+            yield catch_all
+            return
+        key = (msg.performative, msg.thread_id, msg.__class__)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = tuple(self._find_validator_less(msg))
+            self._cache[key] = cached
+            if len(self._cache) > self._CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        yield from cached
+        thread_id = msg.thread_id
+        performative = msg.performative
+        for perf in (performative, None):
+            behaviors = self._validated_by_perf.get(perf)
+            if behaviors:
+                for beh in behaviors:
+                    if beh.template.match_fast(thread_id, performative, msg):
+                        yield beh
+
+    def _find_validator_less(self, msg: Message):
+        """Yields validator-less behaviors matching the given message, bypassing the cache."""
+        thread_id = msg.thread_id
         performative = msg.performative
-        if performative in self._behaviors_by_performative:
-            for beh in self._behaviors_by_performative[performative]:
-                if beh.template.match(msg):
-                    yield beh
-        # Check behaviours without performative specified if not found
-        if None in self._behaviors_by_performative:
-            for beh in self._behaviors_by_performative[None]:
-                if beh.template.match(msg):
-                    yield beh
+        # Check behaviours with matching performative first, then ones without it specified
+        for perf in (performative, None):
+            behaviors = self._fast_by_perf.get(perf)
+            if behaviors:
+                for beh in behaviors:
+                    if beh.template.match_fast(thread_id, performative, msg):
+                        yield beh
 
     @property
     def is_empty(self) -> bool:
-        """Returns true if there are no behaviors."""
-        return len(self._behaviors_by_performative) == 0
+        """Returns true if there are no behaviors. Backed by a counter updated on add/remove."""
+        return self._count == 0
 
 class ThreadDispatcher(MessageDispatcher):
     """
     Stores PerformativeDispatcher grouped by thread id with a separate list for behaviors without thread specified.
     When behaviour is removed checks if nested dispatcher is empty and removes it if so.
+
+    In addition to the nested dispatchers a flat table keyed by (thread_id, performative) is
+    maintained for validator-less behaviors, collapsing the two-level lookup into a single
+    dict access on the dispatch hot path.
     """
+
+    __slots__ = ("_dispatchers_by_thread", "_by_key", "_validated", "_catch_all_single", "_count", "logger")
+
     def __init__(self, logger):
         self._dispatchers_by_thread: Dict[Optional[uuid.UUID], PerformativeDispatcher] = {}
+        self._by_key: Dict[tuple[Optional[uuid.UUID], Optional[str]], List[MessageHandlingBehavior]] = {}
+        self._validated: List[MessageHandlingBehavior] = []
+        self._catch_all_single: Optional[MessageHandlingBehavior] = None
+        self._count = 0
         self.logger = logger
 
     def add_behaviour(self, beh: MessageHandlingBehavior):
@@ -107,6 +183,15 @@ class ThreadDispatcher(MessageDispatcher):
         if thread_id not in self._dispatchers_by_thread:
             self._dispatchers_by_thread[thread_id] = PerformativeDispatcher(logger=self.logger)
         self._dispatchers_by_thread[thread_id].add_behaviour(beh)
+        if not beh.template._has_validator:
+            key = (thread_id, beh.template.performative)
+            if key not in self._by_key:
+                self._by_key[key] = []
+            self._by_key[key].append(beh)
+        else:
+            self._validated.append(beh)
+        self._count += 1
+        self._update_catch_all()
         self.logger.debug("Added behavior %s with thread ID %s", beh, thread_id)
 
     def remove_behaviour(self, beh: MessageHandlingBehavior):
@@ -119,26 +204,58 @@ class ThreadDispatcher(MessageDispatcher):
             self._dispatchers_by_thread[thread_id].remove_behaviour(beh)
             if self._dispatchers_by_thread[thread_id].is_empty:
                 del self._dispatchers_by_thread[thread_id]
+            key = (thread_id, beh.template.performative)
+            if key in self._by_key and beh in self._by_key[key]:
+                self._by_key[key].remove(beh)
+                if not self._by_key[key]:
+                    del self._by_key[key]
+            elif beh in self._validated:
+                self._validated.remove(beh)
+            self._count -= 1
+            self._update_catch_all()
             self.logger.debug("Removed behavior %s with thread ID %s", beh, thread_id)
 
+    def _update_catch_all(self):
+        """
+        Remembers the single registered behavior when its template matches any message, so
+        dispatch bypasses the lookup chain entirely for agents with one catch-all behavior.
+        """
+        if not self._validated and len(self._by_key) == 1:
+            behaviors = self._by_key.get((None, None))
+            if behaviors is not None and len(behaviors) == 1:
+                self._catch_all_single = behaviors[0]
+                return
+        self._catch_all_single = None
+
     def find_matching_behaviour(self, msg: Message):
         """
-        Yields all matching behaviors for the given message.
+        Yields all matching behaviors for the given message. Validator-less behaviors are found
+        with direct lookups in the flat table, behaviors with validators are matched afterwards.
         """
+        catch_all = self._catch_all_single
+        if catch_all is not None:
+            yield catch_all
+            return
         thread_id = msg.thread_id
-        if thread_id and thread_id in self._dispatchers_by_thread:
-            for beh in self._dispatchers_by_thread[thread_id].find_matching_behaviour(msg):
-                yield beh
-        if None in self._dispatchers_by_thread:
-            for beh in self._dispatchers_by_thread[None].find_matching_behaviour(msg):
+        performative = msg.performative
+        if thread_id is not None:
+            keys = ((thread_id, performative), (thread_id, None), (None, performative), (None, None))
+        else:
+            keys = ((None, performative), (None, None))
+        for key in keys:
+            behaviors = self._by_key.get(key)
+            if behaviors:
+                yield from behaviors
+        for beh in self._validated:
+            if beh.template.match_fast(thread_id, performative, msg):
                 yield beh
 
     @property
     def is_empty(self) -> bool:
         """
-        Check if all dispatchers are empty.
+        Check if all dispatchers are empty. Backed by a counter updated on add/remove.
         """
-        return len(self._dispatchers_by_thread) == 0
+        return self._count == 0
 
 class Agent(AgentHandler, BehaviorsOwner, metaclass=ABCMeta):
     """
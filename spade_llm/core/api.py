@@ -10,7 +10,7 @@ from spade_llm import consts
 from spade_llm.core.models import ModelsProvider
 
 
-class AgentId(BaseModel):
+class AgentId(BaseModel, frozen=True):
     agent_type: str = Field(description="Name of the agent type used to route message to a proper system."
                                          "Agent of the same type has the same code base and instruction, but might"
                                          "be provided with different message and context.")
@@ -18,7 +18,7 @@ class AgentId(BaseModel):
     agent_id: str = Field(description="ID of the agent used to provide context and partition work."
                                        "Usually agent ID corresponds to a natural key, for example ID of user.")
 
-class Message(BaseModel):
+class Message(BaseModel, frozen=True):
     sender: AgentId = Field(description="Who sent this message.")
     receiver: AgentId = Field(description="To whom this message is sent.")
     thread_id: Optional[uuid.UUID] = Field(description="ID of the conversation message belongs to.", default=None)
@@ -122,6 +122,15 @@ class MessageSink(metaclass=ABCMeta):
         """
         pass
 
+    async def post_messages(self, msgs: list[Message]):
+        """
+        Posts a batch of messages. Default implementation posts messages one by one,
+        implementations may override it to handle the whole batch at once.
+        :param msgs: Messages to put.
+        """
+        for msg in msgs:
+            await self.post_message(msg)
+
     @abstractmethod
     def post_message_sync(self, msg: Message):
         """
@@ -130,6 +139,15 @@ class MessageSink(metaclass=ABCMeta):
         """
         pass
 
+    def post_messages_sync(self, msgs: list[Message]):
+        """
+        Posts a batch of messages in synchronous mode. Default implementation posts messages
+        one by one, implementations may override it to handle the whole batch at once.
+        :param msgs: Messages to put.
+        """
+        for msg in msgs:
+            self.post_message_sync(msg)
+
     def start(self):
         pass
 
@@ -2,7 +2,8 @@ import logging
 import uuid
 from abc import ABCMeta, abstractmethod
 import asyncio
-from typing import Optional, Callable
+from operator import attrgetter
+from typing import Any, Optional, Callable
 
 from spade_llm import consts
 from spade_llm.core.api import MessageHandler, AgentContext, Message
@@ -38,12 +39,20 @@ class BehaviorsOwner(metaclass=ABCMeta):
 
 class MessageTemplate:
     """
-    Templates are used to filter messages and dispatch them to proper behavior
+    Templates are used to filter messages and dispatch them to proper behavior.
+
+    Uses __slots__ with plain attributes instead of properties: templates are read on the
+    dispatch hot path, so attribute access avoids property-call overhead and the instances
+    stay small.
     """
+
+    __slots__ = ("thread_id", "performative", "validator", "_has_validator", "_getter", "_expected")
+
     def __init__(self,
                  thread_id: Optional[uuid.UUID] = None,
                  performative: Optional[str] = None,
-                 validator: Optional[Callable[[Message], bool]] = None):
+                 validator: Optional[Callable[[Message], bool]] = None,
+                 spec: Optional[dict[str, Any]] = None):
         """
         Initializes the MessageTemplate with optional thread_id, performative, and validator.
 
@@ -51,40 +60,57 @@ class MessageTemplate:
             thread_id (Optional[uuid.UUID], optional): The thread identifier. Defaults to None.
             performative (Optional[str], optional): The performative string. Defaults to None.
             validator (Optional[Callable[[Message], bool]], optional): Lambda function validating the message. Defaults to None.
-        """
-        self._thread_id = thread_id
-        self._performative = performative
-        self._validator = validator
+            spec (Optional[dict[str, Any]], optional): Attribute-equality constraints, for example
+                {"sender.agent_type": "echo"}. Compiled into an operator.attrgetter comparison,
+                which is checked without a Python-level function call per message. Defaults to None.
+        """
+        self.thread_id = thread_id
+        self.performative = performative
+        self.validator = validator
+        if spec:
+            self._getter = attrgetter(*spec)
+            values = tuple(spec.values())
+            self._expected = values[0] if len(values) == 1 else values
+        else:
+            self._getter = None
+            self._expected = None
+        # Spec constraints count as a validator for dispatch purposes: they depend on
+        # message content beyond thread_id and performative
+        self._has_validator = validator is not None or self._getter is not None
 
-    @property
-    def thread_id(self) -> Optional[uuid.UUID]:
-        """
-        Gets the thread id if provided.
+    def match(self, msg: Message) -> bool:
         """
-        return self._thread_id
+        Checks whether the given message matches this template.
 
-    @property
-    def performative(self) -> Optional[str]:
-        """
-        Gets the performative if provided.
+        Args:
+            msg (Message): The message to check.
+
+        Returns:
+            bool: True if the message matches the template, False otherwise.
         """
-        return self._performative
+        return self.match_fast(msg.thread_id, msg.performative, msg)
 
-    def match(self, msg: Message) -> bool:
+    def match_fast(self, thread_id: Optional[uuid.UUID], performative: Optional[str], msg: Message) -> bool:
         """
-        Checks whether the given message matches this template.
+        Hot-path variant of match. The caller extracts thread_id and performative from the
+        message once and passes them in, avoiding repeated attribute loads when the same
+        message is checked against several templates.
 
         Args:
-            msg (Message): The message to check.
+            thread_id (Optional[uuid.UUID]): Thread id extracted from the message.
+            performative (Optional[str]): Performative extracted from the message.
+            msg (Message): The message passed to the validator if one is configured.
 
         Returns:
             bool: True if the message matches the template, False otherwise.
         """
-        if self._thread_id is not None and msg.thread_id != self._thread_id:
+        if self.thread_id is not None and thread_id != self.thread_id:
+            return False
+        if self.performative is not None and performative != self.performative:
             return False
-        if self._performative is not None and msg.performative != self._performative:
+        if self._getter is not None and self._getter(msg) != self._expected:
             return False
-        if self._validator is not None and not self._validator(msg):
+        if self.validator is not None and not self.validator(msg):
             return False
         return True
 
@@ -1,4 +1,6 @@
 import asyncio
+import itertools
+import logging
 from typing import Dict, Optional, cast
 
 from pydantic import BaseModel, Field
@@ -6,6 +8,71 @@ from pydantic import BaseModel, Field
 from spade_llm.core.api import MessageService, MessageSource, Message, MessageBridge, MessageSink
 from spade_llm.core.conf import configuration, Configurable, ConfigurableRecord, EmptyConfig
 
+logger = logging.getLogger(__name__)
+
+
+class MpscRingBuffer:
+    """
+    Fixed-size multi-producer single-consumer ring buffer. Producers claim slots with a monotonic
+    ticket counter (atomic under the GIL) and publish without taking a lock, so concurrent senders
+    never contend on a mutex. The single consumer drains slots in ticket order and is wait-free.
+
+    Each slot holds a single (ticket, item) tuple written with one atomic store, so the consumer
+    always observes a consistent pair. On overflow the oldest unconsumed item is overwritten; the
+    consumer detects the clobbered ticket and accounts for it in the dropped counter.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._capacity = capacity
+        self._slots: list[Optional[tuple]] = [None] * capacity
+        self._tickets = itertools.count()
+        self._head = 0  # Next ticket to consume, owned solely by the consumer
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        """Number of items lost to overflow, detected by the consumer."""
+        return self._dropped
+
+    def is_empty(self) -> bool:
+        entry = self._slots[self._head % self._capacity]
+        return entry is None or entry[0] < self._head
+
+    def push(self, item) -> None:
+        """
+        Claims the next slot and publishes the item into it. Safe to call from any thread:
+        ticket and item are stored together in one assignment, so a publish is atomic.
+        """
+        ticket = next(self._tickets)
+        self._slots[ticket % self._capacity] = (ticket, item)
+
+    def try_pop(self):
+        """
+        Pops the next item in ticket order or returns None if nothing is published yet.
+        Must only be called from the single consumer.
+        """
+        while True:
+            head = self._head
+            idx = head % self._capacity
+            entry = self._slots[idx]
+            if entry is None:
+                return None
+            ticket, item = entry
+            if ticket == head:
+                # Release the item reference but keep the ticket so the slot still reads
+                # as consumed; skip the store if a producer lapped us in the meantime
+                if self._slots[idx] is entry:
+                    self._slots[idx] = (ticket, None)
+                self._head = head + 1
+                return item
+            if ticket > head:
+                # Slot was overwritten by a newer ticket before consumption, skip the lost one
+                self._dropped += 1
+                self._head = head + 1
+                continue
+            # Ticket from a previous lap: nothing published for head yet
+            return None
+
 
 class MessageServiceConfig(ConfigurableRecord):
     def create_messaging_service(self) -> MessageService:
@@ -38,13 +105,32 @@ class DictionaryMessageService(MessageService, Configurable[EmptyConfig]):
         source = self._sources[agent_type]
         source.post_message_sync(msg)
 
+    async def post_messages(self, msgs: list[Message]):
+        self.post_messages_sync(msgs)
+
+    def post_messages_sync(self, msgs: list[Message]):
+        # Group by receiver so each source is looked up once and woken up once per batch
+        by_agent_type: Dict[str, list[Message]] = {}
+        for msg in msgs:
+            by_agent_type.setdefault(msg.receiver.agent_type, []).append(msg)
+        # Validate every receiver before delivering anything so an unknown agent type
+        # fails the whole batch instead of leaving it partially posted
+        for agent_type in by_agent_type:
+            if agent_type not in self._sources:
+                raise Exception(f"No message source found for agent type '{agent_type}'")
+        for agent_type, batch in by_agent_type.items():
+            self._sources[agent_type].post_messages_sync(batch)
+
 
 class MessageSourceImpl(MessageSource):
-    """Concrete implementation of MessageSource using asyncio.Queue."""
+    """Concrete implementation of MessageSource using a lock-free MPSC ring buffer."""
 
-    def __init__(self, agent_type: str, queue_size: int = 50):
+    def __init__(self, agent_type: str, queue_size: int = 1024):
         self._agent_type = agent_type
-        self.queue = asyncio.Queue(maxsize=queue_size)
+        self._ring = MpscRingBuffer(queue_size)
+        self._data_available = asyncio.Event()
+        self._in_flight = 0  # Messages fetched but not yet reported as handled
+        self._reported_dropped = 0  # Drops already written to the log
         self.shutdown_event = asyncio.Event()
         self._loop = asyncio.get_event_loop()  # Memorize current event loop
 
@@ -52,30 +138,59 @@ class MessageSourceImpl(MessageSource):
     def agent_type(self) -> str:
         return self._agent_type
 
+    @property
+    def dropped(self) -> int:
+        """Number of messages lost to queue overflow since this source was created."""
+        return self._ring.dropped
+
+    def _report_dropped(self):
+        dropped = self._ring.dropped
+        if dropped > self._reported_dropped:
+            logger.warning("Message source for '%s' dropped %s message(s) due to queue overflow, "
+                           "%s dropped in total", self._agent_type,
+                           dropped - self._reported_dropped, dropped)
+            self._reported_dropped = dropped
+
     async def fetch_message(self) -> Optional[Message]:
         try:
-            return await self.queue.get()
+            while True:
+                message = self._ring.try_pop()
+                self._report_dropped()
+                if message is not None:
+                    self._in_flight += 1
+                    return message
+                self._data_available.clear()
+                await self._data_available.wait()
         except asyncio.CancelledError:
             return None
 
     async def message_handled(self):
-        self.queue.task_done()
+        self._in_flight -= 1
 
     async def shutdown(self):
         self.shutdown_event.set()
         await self.join()
 
     async def join(self):
-        await self.queue.join()
+        while not self._ring.is_empty() or self._in_flight > 0:
+            await asyncio.sleep(0.05)
 
     async def post_message(self, message: Message):
         self.post_message_sync(message)
 
     def post_message_sync(self, message: Message):
         if not self.shutdown_event.is_set():
-            # Use call_soon_threadsafe to safely enqueue the message
-            callback = lambda: asyncio.ensure_future(self.queue.put(message))
-            self._loop.call_soon_threadsafe(callback)
+            # Lock-free push, only the consumer wake-up goes through the event loop
+            self._ring.push(message)
+            self._loop.call_soon_threadsafe(self._data_available.set)
+
+    def post_messages_sync(self, messages: list[Message]):
+        if not self.shutdown_event.is_set():
+            push = self._ring.push
+            for message in messages:
+                push(message)
+            # Single consumer wake-up for the whole batch
+            self._loop.call_soon_threadsafe(self._data_available.set)
 
     @agent_type.setter
     def agent_type(self, value):
@@ -143,4 +258,16 @@ class ExposedMessageSource(MessageService, Configurable[ExposedMessageServiceCon
 
     def post_message_sync(self, msg: Message):
         new_msg, sink = self.get_sink_for_message(msg)
-        sink.post_message_sync(new_msg)
\ No newline at end of file
+        sink.post_message_sync(new_msg)
+
+    async def post_messages(self, msgs: list[Message]):
+        self.post_messages_sync(msgs)
+
+    def post_messages_sync(self, msgs: list[Message]):
+        # Group by resolved sink so internal and external batches are forwarded in bulk
+        by_sink: dict[int, tuple[MessageSink, list[Message]]] = {}
+        for msg in msgs:
+            new_msg, sink = self.get_sink_for_message(msg)
+            by_sink.setdefault(id(sink), (sink, []))[1].append(new_msg)
+        for sink, batch in by_sink.values():
+            sink.post_messages_sync(batch)
\ No newline at end of file
@@ -123,7 +123,7 @@ class DelegateToolConfig(BaseModel, LocalToolFactory):
 
             receiver = ReceiverBehavior(MessageTemplate(
                 thread_id=context.thread_id,
-                validator = MessageTemplate.from_agent(self.agent_type)
+                spec={"sender.agent_type": self.agent_type}
             ))
             agent.add_behaviour(receiver)
 
@@ -1,18 +1,27 @@
+import asyncio
 import logging
 import threading
+from concurrent.futures import Future
+from typing import Optional
 
 from aiologic import Event
-from confluent_kafka import Consumer
+from confluent_kafka import Consumer, TopicPartition
 from pydantic import Field
 
 from spade_llm.core.api import MessageSink, Message, MessageBridge
 from spade_llm.core.conf import configuration, Configurable
+from spade_llm.core.threading import EventLoopThread
 from spade_llm.kafka.sink import KafkaConfig
 
 logger = logging.getLogger(__name__)
 
 
 class KafkaConsumerConfig(KafkaConfig, extra="allow"):
+    """
+    Configuration for the Kafka consumer. Extra attributes are passed through to librdkafka
+    as-is, so any native option (for example compression is handled transparently on the
+    consumer side once compression.type is set on the producer) can be supplied in the config.
+    """
     group_id: str = Field(
         serialization_alias="group.id",
         description="Kafka consumer group ID"
@@ -21,6 +30,42 @@ class KafkaConsumerConfig(KafkaConfig, extra="allow"):
         default={},
         description="Mapping from agent types to Kafka topics. By default, agent type is used as a topic",
     )
+    max_poll_records: int = Field(
+        default=500,
+        description="Maximum number of messages to fetch from Kafka in a single consume call",
+    )
+    adaptive_batch_size: bool = Field(
+        default=True,
+        description="Start consuming with small batches and grow up to max_poll_records based on "
+                    "observed batch fill ratio",
+    )
+    fetch_wait_max_ms: int = Field(
+        default=200,
+        serialization_alias="fetch.wait.max.ms",
+        description="Maximum time the broker may wait to fill the fetch response",
+    )
+    fetch_min_bytes: int = Field(
+        default=64 * 1024,
+        serialization_alias="fetch.min.bytes",
+        description="Minimum number of bytes the broker responds with",
+    )
+    fetch_message_max_bytes: int = Field(
+        default=5 * 1024 * 1024,
+        serialization_alias="fetch.message.max.bytes",
+        description="Maximum number of bytes per topic+partition to request when fetching messages. "
+                    "librdkafka also accepts this as max.partition.fetch.bytes",
+    )
+    session_timeout_ms: int = Field(
+        default=45000,
+        serialization_alias="session.timeout.ms",
+        description="Kafka group session timeout",
+    )
+    static_assignment: bool = Field(
+        default=True,
+        description="Assign topic partitions directly from cluster metadata instead of subscribing. "
+                    "Avoids group rebalance stalls since the topic set is static, falls back to "
+                    "subscribe when metadata is unavailable",
+    )
 
 
 
@@ -28,47 +73,147 @@ class KafkaConsumerConfig(KafkaConfig, extra="allow"):
 class KafkaMessageSource(Configurable[KafkaConsumerConfig], MessageBridge):
     _consumer: Consumer
     _running: bool = False
-    _thread: threading.Thread
+    _future: Optional[Future] = None
     _is_done: Event
     _is_started: Event
+    _kwargs: Optional[dict] = None
+    _topics: tuple[str, ...] = ()
+
+    # All sources share a single event loop thread so that any number of exposed agent
+    # groups costs one OS thread instead of one thread per source
+    _shared_loop_thread: Optional[EventLoopThread] = None
+    _shared_sources: int = 0
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def _acquire_shared_loop(cls) -> EventLoopThread:
+        with cls._shared_lock:
+            if cls._shared_loop_thread is None:
+                cls._shared_loop_thread = EventLoopThread()
+                cls._shared_loop_thread.start()
+            cls._shared_sources += 1
+            return cls._shared_loop_thread
+
+    @classmethod
+    def _release_shared_loop(cls):
+        with cls._shared_lock:
+            cls._shared_sources -= 1
+            if cls._shared_sources == 0 and cls._shared_loop_thread is not None:
+                cls._shared_loop_thread.stop()
+                cls._shared_loop_thread = None
 
     def configure(self):
         logger.info("Initializing KafkaMessageSource")
-        self._consumer = Consumer(self.config.model_dump(
-            by_alias=True, exclude={"agent_to_topic_mapping", "exposed_agents"}))
+        if self._kwargs is None:
+            # Alias resolution in model_dump is not free, compute the consumer kwargs once
+            # so reconfiguration (or sources sharing a base config) skips it
+            self._kwargs = self.config.model_dump(
+                by_alias=True,
+                exclude={"agent_to_topic_mapping", "exposed_agents", "max_poll_records",
+                         "adaptive_batch_size", "static_assignment"})
+        self._consumer = Consumer(self._kwargs)
         self._is_done = Event()
         self._is_started = Event()
 
     async def start(self, sink: MessageSink, exposed_agents: set[str]):
         logger.info("Starting KafkaMessageSource")
         self._running = True
-        self._thread = threading.Thread(target=self.consume_messages, args=(sink,exposed_agents,))
-        self._thread.start()
+        mapping = self.config.agent_to_topic_mapping
+        self._topics = tuple(mapping.get(agent, agent) for agent in exposed_agents)
+        loop_thread = self._acquire_shared_loop()
+        self._future = asyncio.run_coroutine_threadsafe(
+            self.consume_messages(sink), loop_thread.loop)
         await self._is_started
 
     def assignment_callback(self, consumer, partitions):
         logger.info("Kafka partitions assigned: %s", partitions)
         self._is_started.set()
 
-    def consume_messages(self, sink: MessageSink, exposed_agents: set[str]):
+    def _list_partitions(self, topics: list[str]) -> Optional[list[TopicPartition]]:
+        """
+        Fetches partitions for the given topics from cluster metadata. Returns None if
+        metadata is unavailable for any topic so the caller can fall back to subscribe.
+        """
+        try:
+            partitions = []
+            for topic in topics:
+                metadata = self._consumer.list_topics(topic, timeout=10.0)
+                topic_meta = metadata.topics.get(topic)
+                if topic_meta is None or topic_meta.error is not None or not topic_meta.partitions:
+                    logger.warning("No metadata for topic '%s', falling back to subscribe", topic)
+                    return None
+                partitions.extend(TopicPartition(topic, p) for p in topic_meta.partitions)
+            return partitions
+        except Exception as e:
+            logger.warning("Failed to fetch partition metadata, falling back to subscribe: %s", e)
+            return None
+
+    async def consume_messages(self, sink: MessageSink):
         try:
-            topics = [self.config.agent_to_topic_mapping.get(agent, agent) for agent in exposed_agents]
-            logger.info("Subscribing to topics %s", topics)
-            self._consumer.subscribe(topics, on_assign=self.assignment_callback)
+            topics = list(self._topics)
+            partitions = self._list_partitions(topics) if self.config.static_assignment else None
+            if partitions is not None:
+                # Topic set is static, assign partitions directly to skip group rebalances
+                logger.info("Assigning partitions %s", partitions)
+                self._consumer.assign(partitions)
+                self._is_started.set()
+            else:
+                logger.info("Subscribing to topics %s", topics)
+                self._consumer.subscribe(topics, on_assign=self.assignment_callback)
+
+            max_records = self.config.max_poll_records
+            adaptive = self.config.adaptive_batch_size
+            num_messages = min(64, max_records) if adaptive else max_records
+
+            # Bind hot-loop attributes to locals to cut interpreter overhead per iteration
+            consume = self._consumer.consume
+            post_messages = sink.post_messages_sync
+            validate = Message.model_validate_json
+            sleep = asyncio.sleep
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
             while self._running:
-                logger.debug("Polling Kafka")
-                msg = self._consumer.poll(timeout=1.0)
-                if msg is None:
+                # Non-blocking consume to avoid stalling the event loop, idle time is spent
+                # in asyncio.sleep instead of inside librdkafka
+                msgs = consume(num_messages=num_messages, timeout=0)
+                if adaptive:
+                    # Start small and grow while batches come back full, shrink when traffic drops
+                    if len(msgs) == num_messages:
+                        num_messages = min(num_messages * 2, max_records)
+                    elif len(msgs) < num_messages // 4:
+                        num_messages = max(num_messages // 2, min(64, max_records))
+                if not msgs:
+                    await sleep(0.05)
                     continue
-                elif msg.error():
-                    logger.warning("Kafka error %s", msg.error())
-                else:
-                    logger.debug("Received message %s", msg.value().decode())
+                batch: list[Message] = []
+                for msg in msgs:
+                    if msg.error():
+                        logger.warning("Kafka error %s", msg.error())
+                        continue
+                    # Materialize the payload bytes once and parse them directly,
+                    # skipping the intermediate str copy
+                    payload = msg.value()
+                    if debug_enabled:
+                        logger.debug("Received message %s", payload.decode())
                     try:
-                        sink.post_message_sync(Message.model_validate_json(msg.value().decode()))
+                        batch.append(validate(payload))
                     except Exception as e:
                         logger.exception("Failed to process message %s due to %s", msg, e)
+                if batch:
+                    try:
+                        post_messages(batch)
+                    except Exception as e:
+                        # A bad receiver must not kill the consume loop, retry one by one so
+                        # only the offending messages are lost
+                        logger.exception("Failed to post batch of %s messages due to %s",
+                                         len(batch), e)
+                        for message in batch:
+                            try:
+                                sink.post_message_sync(message)
+                            except Exception as e:
+                                logger.exception("Failed to post message %s due to %s", message, e)
+                # Give other coroutines on the loop a chance to run between batches
+                await sleep(0)
         except Exception as e:
             logger.exception("Exception caught in KafkaMessageSource: %s", e)
         finally:
@@ -77,10 +222,18 @@ class KafkaMessageSource(Configurable[KafkaConsumerConfig], MessageBridge):
             finally:
                 logger.info("Stopping KafkaMessageSource")
                 self._is_done.set()
+                self._release_shared_loop()
 
     def stop(self):
         logger.info("Stop requested for KafkaMessageSource")
         self._running = False
 
     async def join(self):
+        """
+        Waits for the consume loop to finish. Purely event-based: no thread join and no
+        threadpool worker is held, the consume coroutine signals completion via _is_done
+        and its future resolves once the consumer is closed.
+        """
         await self._is_done
+        if self._future is not None:
+            await asyncio.wrap_future(self._future)
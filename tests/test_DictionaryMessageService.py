@@ -29,5 +29,44 @@ class TestDictionaryMessageService(unittest.IsolatedAsyncioTestCase):
         
         self.assertEqual(retrieved_msg.content, 'Test message')
 
+    async def test_post_messages_to_multiple_receivers(self):
+        dms = DictionaryMessageService()
+        source_a = await dms.get_or_create_source('agent-a')
+        source_b = await dms.get_or_create_source('agent-b')
+
+        sender = AgentId(agent_type="agent-a", agent_id="sender-id")
+        msgs = [
+            Message(sender=sender, receiver=AgentId(agent_type="agent-a", agent_id="1"),
+                    content='First', performative="inform"),
+            Message(sender=sender, receiver=AgentId(agent_type="agent-b", agent_id="2"),
+                    content='Second', performative="inform"),
+            Message(sender=sender, receiver=AgentId(agent_type="agent-a", agent_id="3"),
+                    content='Third', performative="inform"),
+        ]
+
+        await dms.post_messages(msgs)
+
+        self.assertEqual((await source_a.fetch_message()).content, 'First')
+        self.assertEqual((await source_a.fetch_message()).content, 'Third')
+        self.assertEqual((await source_b.fetch_message()).content, 'Second')
+
+    async def test_post_messages_with_unknown_receiver(self):
+        dms = DictionaryMessageService()
+        source = await dms.get_or_create_source('agent-a')
+
+        sender = AgentId(agent_type="agent-a", agent_id="sender-id")
+        msgs = [
+            Message(sender=sender, receiver=AgentId(agent_type="agent-a", agent_id="1"),
+                    content='Known receiver', performative="inform"),
+            Message(sender=sender, receiver=AgentId(agent_type="missing", agent_id="2"),
+                    content='Unknown receiver', performative="inform"),
+        ]
+
+        with self.assertRaises(Exception):
+            await dms.post_messages(msgs)
+
+        # The batch must fail as a whole without partial delivery
+        self.assertTrue(source._ring.is_empty())
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+from spade_llm.core.api import AgentId, Message, MessageSink
+from spade_llm.core.messaging import ExposedMessageSource
+
+
+class RecordingSink(MessageSink):
+    def __init__(self):
+        self.messages: list[Message] = []
+
+    async def post_message(self, msg: Message):
+        self.post_message_sync(msg)
+
+    def post_message_sync(self, msg: Message):
+        self.messages.append(msg)
+
+
+class TestExposedMessageSource(unittest.TestCase):
+    def setUp(self):
+        self.source = ExposedMessageSource()
+        self.internal = RecordingSink()
+        self.external = RecordingSink()
+        self.source.internal = self.internal
+        self.source.external_systems = {"ext": self.external}
+
+    def make_message(self, receiver_type: str, content: str) -> Message:
+        return Message(
+            sender=AgentId(agent_type="local", agent_id="sender"),
+            receiver=AgentId(agent_type=receiver_type, agent_id="receiver"),
+            content=content,
+            performative="inform")
+
+    def test_post_messages_splits_internal_and_external(self):
+        msgs = [
+            self.make_message("local", "first"),
+            self.make_message("remote@ext", "second"),
+            self.make_message("local", "third"),
+        ]
+
+        self.source.post_messages_sync(msgs)
+
+        self.assertEqual([msg.content for msg in self.internal.messages], ["first", "third"])
+        self.assertEqual(len(self.external.messages), 1)
+        forwarded = self.external.messages[0]
+        self.assertEqual(forwarded.content, "second")
+        # Addressing is rewritten for the external system
+        self.assertEqual(forwarded.receiver.agent_type, "remote")
+        self.assertEqual(forwarded.sender.agent_type, "local@ext")
+
+    def test_post_messages_with_unknown_system(self):
+        with self.assertRaises(Exception):
+            self.source.post_messages_sync([self.make_message("remote@unknown", "lost")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,6 +34,39 @@ class CounterBehavior(Behaviour):
     def is_done(self) -> bool:
         return self.counter >= 3
 
+class TestMessageTemplate(unittest.TestCase):
+    def make_message(self, sender_type: str = 'test-sender', performative: str = 'inform') -> Message:
+        return Message(
+            sender=AgentId(agent_type=sender_type, agent_id='sender-agent'),
+            receiver=AgentId(agent_type='test-receiver', agent_id='receiver-agent'),
+            performative=performative,
+            content='Test message')
+
+    def test_spec_single_key(self):
+        template = MessageTemplate(spec={"sender.agent_type": "test-sender"})
+        self.assertTrue(template.match(self.make_message()))
+        self.assertFalse(template.match(self.make_message(sender_type='other-sender')))
+
+    def test_spec_multiple_keys(self):
+        template = MessageTemplate(spec={
+            "sender.agent_type": "test-sender",
+            "sender.agent_id": "sender-agent",
+        })
+        self.assertTrue(template.match(self.make_message()))
+        self.assertFalse(template.match(self.make_message(sender_type='other-sender')))
+
+    def test_spec_combined_with_performative(self):
+        template = MessageTemplate(performative="inform", spec={"sender.agent_type": "test-sender"})
+        self.assertTrue(template.match(self.make_message()))
+        self.assertFalse(template.match(self.make_message(performative='request')))
+
+    def test_spec_counts_as_validator(self):
+        # Spec constraints depend on message content, so dispatchers must not treat
+        # the template as matchable by performative and thread alone
+        self.assertTrue(MessageTemplate(spec={"sender.agent_type": "test-sender"})._has_validator)
+        self.assertFalse(MessageTemplate(performative="inform")._has_validator)
+
+
 class TestBehaviours(unittest.TestCase):
     async def execute_behavior(self, behavior: Behaviour):
         # Create instance of MockAgent
@@ -35,10 +35,10 @@ class TestPerformativeDispatcher(unittest.TestCase):
         template = MessageTemplate(performative='test')
         mock_behaviour = MockBehavior(template)
         self.dispatcher.add_behaviour(mock_behaviour)
-        self.assertTrue('test' in self.dispatcher._behaviors_by_performative)
-        self.assertEqual(len(self.dispatcher._behaviors_by_performative['test']), 1)
+        self.assertTrue('test' in self.dispatcher._fast_by_perf)
+        self.assertEqual(len(self.dispatcher._fast_by_perf['test']), 1)
         self.dispatcher.remove_behaviour(mock_behaviour)
-        self.assertFalse('test' in self.dispatcher._behaviors_by_performative)
+        self.assertFalse('test' in self.dispatcher._fast_by_perf)
 
     def test_is_empty(self):
         # Initially dispatcher should be empty
@@ -95,6 +95,24 @@ class TestPerformativeDispatcher(unittest.TestCase):
         self.assertIn(mock_behaviour_1, found_behaviours)
         self.assertIn(mock_behaviour_2, found_behaviours)
 
+    def test_spec_template_dispatch(self):
+        # Templates with a spec depend on message content, so they go to the validated
+        # store and are matched per message instead of by performative alone
+        template = MessageTemplate(performative='test', spec={"sender.agent_type": "TestSender"})
+        mock_behaviour = MockBehavior(template)
+        self.dispatcher.add_behaviour(mock_behaviour)
+        self.assertIn('test', self.dispatcher._validated_by_perf)
+        self.assertNotIn('test', self.dispatcher._fast_by_perf)
+
+        receiver = AgentId(agent_type="TestReceiver", agent_id="2")
+        matching = Message(sender=AgentId(agent_type="TestSender", agent_id="1"),
+                           receiver=receiver, performative='test', content='')
+        other = Message(sender=AgentId(agent_type="OtherSender", agent_id="1"),
+                        receiver=receiver, performative='test', content='')
+
+        self.assertEqual(list(self.dispatcher.find_matching_behaviour(matching)), [mock_behaviour])
+        self.assertEqual(list(self.dispatcher.find_matching_behaviour(other)), [])
+
 
 class TestThreadDispatcher(unittest.TestCase):
     def setUp(self):
@@ -112,7 +130,7 @@ class TestThreadDispatcher(unittest.TestCase):
         self.assertEqual(len(self.dispatcher._dispatchers_by_thread), 0)
         self.dispatcher.add_behaviour(self.behavior_mock_1)
         self.assertIn(self.thread_id_1, self.dispatcher._dispatchers_by_thread)
-        self.assertEqual(len(self.dispatcher._dispatchers_by_thread[self.thread_id_1]._behaviors_by_performative.get(None)), 1)
+        self.assertEqual(len(self.dispatcher._dispatchers_by_thread[self.thread_id_1]._fast_by_perf.get(None)), 1)
         self.dispatcher.remove_behaviour(self.behavior_mock_1)
         self.assertNotIn(self.thread_id_1, self.dispatcher._dispatchers_by_thread)
 